@@ -3,16 +3,36 @@
 A comprehensive Life Cycle Management automation toolkit.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Code4Ved Team"
 __email__ = "team@Code4Ved.com"
 
-from .core import Code4VedManager
-from .exceptions import Code4VedError, Code4VedConfigError, Code4VedValidationError
+if TYPE_CHECKING:
+    from .core import Code4VedManager
+    from .exceptions import Code4VedError, Code4VedConfigError, Code4VedValidationError
 
 __all__ = [
     "Code4VedManager",
     "Code4VedError",
     "Code4VedConfigError",
     "Code4VedValidationError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access.
+
+    Keeps ``import code4ved`` (and ``code4ved version``) from loading the
+    settings and models stack until it is actually needed.
+    """
+    if name == "Code4VedManager":
+        from .core import Code4VedManager
+
+        return Code4VedManager
+    if name in ("Code4VedError", "Code4VedConfigError", "Code4VedValidationError"):
+        from . import exceptions
+
+        return getattr(exceptions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
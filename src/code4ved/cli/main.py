@@ -1,27 +1,45 @@
 """Main CLI interface for Code4Ved Automation."""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from .. import __version__
-from ..core import Code4VedManager
-from ..core.models import Resource, LifecycleStage, ResourceStatus
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..core import Code4VedManager
+
+# Rich, the manager and the models are imported inside the commands that
+# use them so that fast commands such as ``version`` stay cheap.
 
 app = typer.Typer(help="Code4Ved Automation CLI")
-console = Console()
+
+# Global console instance
+console: Optional["Console"] = None
 
 # Global manager instance
-manager: Optional[Code4VedManager] = None
+manager: Optional["Code4VedManager"] = None
+
+
+def get_console() -> "Console":
+    """Get or create the Rich console instance."""
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
+    return console
 
 
-def get_manager() -> Code4VedManager:
+def get_manager() -> "Code4VedManager":
     """Get or create Code4Ved manager instance."""
     global manager
     if manager is None:
+        from ..core import Code4VedManager
+
         manager = Code4VedManager()
     return manager
 
@@ -29,12 +47,14 @@ def get_manager() -> Code4VedManager:
 @app.command()
 def version():
     """Show version information."""
-    console.print(f"Code4Ved Automation version: {__version__}")
+    get_console().print(f"Code4Ved Automation version: {__version__}")
 
 
 @app.command()
 def status():
     """Show current Code4Ved status."""
+    from rich.table import Table
+
     mgr = get_manager()
     status_info = mgr.get_status()
 
@@ -47,7 +67,7 @@ def status():
             value = ", ".join(str(v) for v in value)
         table.add_row(key.replace("_", " ").title(), str(value))
 
-    console.print(table)
+    get_console().print(table)
 
 
 @app.group()
@@ -59,11 +79,13 @@ def resource():
 @resource.command("list")
 def list_resources():
     """List all resources."""
+    from rich.table import Table
+
     mgr = get_manager()
     resources = mgr.list_resources()
 
     if not resources:
-        console.print("No resources found.")
+        get_console().print("No resources found.")
         return
 
     table = Table(title="Resources")
@@ -75,7 +97,7 @@ def list_resources():
     for res in resources:
         table.add_row(res.id, res.name, res.type, res.status)
 
-    console.print(table)
+    get_console().print(table)
 
 
 @resource.command("add")
@@ -85,6 +107,8 @@ def add_resource(
     resource_type: str = typer.Option(..., "--type", "-t", help="Resource type"),
 ):
     """Add a new resource."""
+    from ..core.models import Resource, ResourceStatus
+
     mgr = get_manager()
 
     new_resource = Resource(
@@ -96,9 +120,9 @@ def add_resource(
 
     try:
         mgr.add_resource(new_resource)
-        console.print(f"✅ Resource '{resource_id}' added successfully.")
+        get_console().print(f"✅ Resource '{resource_id}' added successfully.")
     except Exception as e:
-        console.print(f"❌ Error adding resource: {e}")
+        get_console().print(f"❌ Error adding resource: {e}")
         raise typer.Exit(1)
 
 
@@ -111,9 +135,9 @@ def remove_resource(
 
     try:
         mgr.remove_resource(resource_id)
-        console.print(f"✅ Resource '{resource_id}' removed successfully.")
+        get_console().print(f"✅ Resource '{resource_id}' removed successfully.")
     except Exception as e:
-        console.print(f"❌ Error removing resource: {e}")
+        get_console().print(f"❌ Error removing resource: {e}")
         raise typer.Exit(1)
 
 
@@ -122,6 +146,8 @@ def show_resource(
     resource_id: str = typer.Argument(..., help="Resource ID to show")
 ):
     """Show resource details."""
+    from rich.table import Table
+
     mgr = get_manager()
 
     try:
@@ -140,10 +166,10 @@ def show_resource(
             table.add_row("Updated", res.updated_at.isoformat())
         table.add_row("Tags", ", ".join(res.tags) if res.tags else "None")
 
-        console.print(table)
+        get_console().print(table)
 
     except Exception as e:
-        console.print(f"❌ Error showing resource: {e}")
+        get_console().print(f"❌ Error showing resource: {e}")
         raise typer.Exit(1)
 
 
@@ -160,6 +186,8 @@ def add_stage(
     order: int = typer.Option(1, "--order", "-o", help="Execution order"),
 ):
     """Add a new lifecycle stage."""
+    from ..core.models import LifecycleStage
+
     mgr = get_manager()
 
     new_stage = LifecycleStage(
@@ -169,7 +197,7 @@ def add_stage(
     )
 
     mgr.add_stage(new_stage)
-    console.print(f"✅ Stage '{name}' added successfully.")
+    get_console().print(f"✅ Stage '{name}' added successfully.")
 
 
 @stage.command("execute")
@@ -182,10 +210,10 @@ def execute_stage(
 
     try:
         result = mgr.execute_stage(stage_name, resource_id)
-        console.print(f"✅ Stage '{stage_name}' executed successfully for resource '{resource_id}'")
-        console.print(f"Result: {result}")
+        get_console().print(f"✅ Stage '{stage_name}' executed successfully for resource '{resource_id}'")
+        get_console().print(f"Result: {result}")
     except Exception as e:
-        console.print(f"❌ Error executing stage: {e}")
+        get_console().print(f"❌ Error executing stage: {e}")
         raise typer.Exit(1)
 
 
@@ -196,9 +224,9 @@ def validate():
 
     try:
         mgr.validate_config()
-        console.print("✅ Configuration is valid.")
+        get_console().print("✅ Configuration is valid.")
     except Exception as e:
-        console.print(f"❌ Configuration validation failed: {e}")
+        get_console().print(f"❌ Configuration validation failed: {e}")
         raise typer.Exit(1)
 
 
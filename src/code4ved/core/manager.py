@@ -22,6 +22,7 @@ class Code4VedManager:
         self.config = config or Code4VedConfig.from_settings()
         self.resources: Dict[str, Resource] = {}
         self.stages: List[LifecycleStage] = []
+        self._stage_index: Dict[str, LifecycleStage] = {}
 
         logger.info(f"Code4Ved Manager initialized with config: {self.config.name}")
 
@@ -87,6 +88,8 @@ class Code4VedManager:
             stage: Lifecycle stage to add
         """
         self.stages.append(stage)
+        # First stage registered under a name wins, as with the old list scan
+        self._stage_index.setdefault(stage.name, stage)
         logger.info(f"Added lifecycle stage: {stage.name}")
 
     def execute_stage(self, stage_name: str, resource_id: str) -> Dict[str, Any]:
@@ -103,11 +106,7 @@ class Code4VedManager:
             Code4VedError: If stage or resource not found
         """
         # Find stage
-        stage = None
-        for s in self.stages:
-            if s.name == stage_name:
-                stage = s
-                break
+        stage = self._stage_index.get(stage_name)
 
         if not stage:
             raise Code4VedError(f"Stage {stage_name} not found")
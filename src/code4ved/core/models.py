@@ -147,12 +147,16 @@ class LifecycleStage(BaseModel):
         # This is a placeholder implementation
         # In a real implementation, this would execute the actual stage logic
 
+        # No work happens between start and completion yet, so a single
+        # wall-clock snapshot serves both timestamps.
+        timestamp = datetime.utcnow().isoformat()
+
         result = {
             "stage": self.name,
             "resource_id": resource.id,
             "status": StageStatus.COMPLETED,
-            "started_at": datetime.utcnow().isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
+            "started_at": timestamp,
+            "completed_at": timestamp,
             "actions_executed": self.actions,
             "metadata": self.metadata
         }
@@ -6,9 +6,13 @@ class Code4VedError(Exception):
 
     def __init__(self, message: str, code: str = None):
         super().__init__(message)
-        self.message = message
         self.code = code
 
+    @property
+    def message(self) -> str:
+        """Error message, as passed to the constructor."""
+        return self.args[0] if self.args else ""
+
 
 class Code4VedConfigError(Code4VedError):
     """Raised when there's a configuration error."""
@@ -14,7 +14,7 @@ def generate_id(prefix: Optional[str] = None) -> str:
     Returns:
         Unique identifier string
     """
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = uuid.uuid4().hex[:8]
     return f"{prefix}-{unique_id}" if prefix else unique_id
 
 
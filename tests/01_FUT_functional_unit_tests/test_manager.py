@@ -81,6 +81,15 @@ class TestCode4VedManager:
         assert result["resource_id"] == "test-resource-1"
         assert result["status"] == "completed"
 
+    def test_execute_stage_duplicate_name_uses_first(self, populated_manager):
+        """Test executing a stage name registered twice uses the first one."""
+        populated_manager.add_stage(
+            LifecycleStage(name="test-stage", order=2, actions=["other_action"])
+        )
+        result = populated_manager.execute_stage("test-stage", "test-resource-1")
+
+        assert result["actions_executed"] == ["test_action"]
+
     def test_execute_nonexistent_stage(self, populated_manager):
         """Test executing nonexistent stage raises error."""
         with pytest.raises(Code4VedError, match="Stage nonexistent not found"):